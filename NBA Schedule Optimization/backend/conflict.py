@@ -4,9 +4,24 @@ nba_venues.csv. Provides get_conflict() for use by the scheduler and stress-test
 """
 
 import os
+import re
+
 import pandas as pd
 
 _conflict_matrix: pd.DataFrame | None = None
+_conflict_lookup: dict[str, dict[pd.Timestamp, float]] | None = None
+
+# Keywords that identify NBA game listings in the events CSV (as opposed to
+# competing events). Compiled once; main.py uses the same regex.
+NBA_KEYWORDS = [
+    "vs.", "vs ", " at ", " @ ", "nba", "hawks", "celtics", "nets",
+    "hornets", "bulls", "cavaliers", "mavericks", "nuggets", "pistons",
+    "warriors", "rockets", "pacers", "clippers", "lakers", "grizzlies",
+    "heat", "bucks", "timberwolves", "pelicans", "knicks", "thunder",
+    "magic", "76ers", "suns", "trail blazers", "blazers", "kings", "spurs",
+    "raptors", "jazz", "wizards",
+]
+NBA_RE = re.compile("|".join(re.escape(kw) for kw in NBA_KEYWORDS), re.IGNORECASE)
 
 
 def _load_matrix(data_dir: str = "") -> pd.DataFrame:
@@ -16,37 +31,25 @@ def _load_matrix(data_dir: str = "") -> pd.DataFrame:
     venues_df = pd.read_csv(venues_path)
     events_df = pd.read_csv(events_path, parse_dates=["date"])
 
-    # Strip NBA game listings from events
-    nba_keywords = [
-        "vs.", "vs ", " at ", " @ ", "nba", "hawks", "celtics", "nets",
-        "hornets", "bulls", "cavaliers", "mavericks", "nuggets", "pistons",
-        "warriors", "rockets", "pacers", "clippers", "lakers", "grizzlies",
-        "heat", "bucks", "timberwolves", "pelicans", "knicks", "thunder",
-        "magic", "76ers", "suns", "trail blazers", "blazers", "kings", "spurs",
-        "raptors", "jazz", "wizards",
-    ]
+    # Strip NBA game listings from events with one vectorized regex scan
+    # instead of ~35 Python substring checks per row.
     title_col = "name" if "name" in events_df.columns else "title"
-    mask = ~events_df[title_col].str.lower().apply(
-        lambda x: any(kw in str(x) for kw in nba_keywords)
-    )
-    competing_df = events_df[mask].copy()
-
-    # Venue x date conflict counts
-    conflict = (
-        competing_df.groupby(["venue", "date"])
-        .size()
-        .reset_index(name="conflict_count")
-    )
+    mask = ~events_df[title_col].fillna("").str.contains(NBA_RE)
+    competing_df = events_df[mask]
 
     playoff_start = pd.Timestamp("2026-04-14")
     playoff_end = pd.Timestamp("2026-06-19")
     all_dates = pd.date_range(playoff_start, playoff_end)
     all_venues = venues_df["Venue Name"].tolist()
 
-    matrix = pd.DataFrame(0, index=all_venues, columns=all_dates)
-    for _, row in conflict.iterrows():
-        if row["venue"] in matrix.index and row["date"] in matrix.columns:
-            matrix.loc[row["venue"], row["date"]] = row["conflict_count"]
+    # Venue x date conflict counts, pivoted in one shot; reindex to the full
+    # venue/date grid (zero-filled) instead of a per-cell fill loop.
+    matrix = (
+        competing_df.groupby(["venue", "date"])
+        .size()
+        .unstack(fill_value=0)
+        .reindex(index=all_venues, columns=all_dates, fill_value=0)
+    )
 
     return matrix
 
@@ -58,9 +61,22 @@ def get_matrix(data_dir: str = "") -> pd.DataFrame:
     return _conflict_matrix
 
 
+def get_lookup(data_dir: str = "") -> dict[str, dict[pd.Timestamp, float]]:
+    """Per-venue {date: conflict_count} dicts, built once from the matrix.
+
+    Only non-zero cells are stored, so lookups in tight scheduling loops are
+    two dict probes instead of a DataFrame label lookup.
+    """
+    global _conflict_lookup
+    if _conflict_lookup is None:
+        matrix = get_matrix(data_dir)
+        _conflict_lookup = {
+            venue: {d: float(v) for d, v in zip(matrix.columns, row) if v > 0}
+            for venue, row in zip(matrix.index, matrix.to_numpy())
+        }
+    return _conflict_lookup
+
+
 def get_conflict(venue: str, date, data_dir: str = "") -> float:
-    matrix = get_matrix(data_dir)
-    d = pd.Timestamp(date)
-    if venue in matrix.index and d in matrix.columns:
-        return float(matrix.loc[venue, d])
-    return 0.0
+    lookup = get_lookup(data_dir)
+    return lookup.get(venue, {}).get(pd.Timestamp(date), 0.0)
@@ -7,6 +7,7 @@ import os
 import pandas as pd
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -23,7 +24,7 @@ import numpy as np
 from simulator import run_simulation, filter_samples, build_bracket, simulate_playin
 from scheduler import schedule_bracket, FINALS_DATES
 from seeds import default_first_round as _default_first_round
-from conflict import get_conflict, get_matrix
+from conflict import NBA_RE, get_lookup, get_matrix
 from sessions import create_session, get_session, lock_series, unlock_series, reset_locks, set_game_cache
 from seeds import EAST_SEEDS, WEST_SEEDS
 import net_ratings as _net_ratings_module
@@ -47,6 +48,13 @@ def get_team_venue() -> dict[str, str]:
     return dict(zip(df["Team"], df["Venue Name"]))
 
 
+@lru_cache(maxsize=1)
+def _load_events_df() -> pd.DataFrame:
+    """Events CSV, read and date-parsed once per process (callers must not mutate)."""
+    events_path = os.path.join(DATA_DIR, "nba_playoff_events_2026.csv")
+    return pd.read_csv(events_path, parse_dates=["date"])
+
+
 # Pre-warm conflict matrix on startup
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -72,9 +80,8 @@ app.add_middleware(
 def list_venues():
     df = get_venues_df()
     return [
-        VenueInfo(team=row["Team"], venue=row["Venue Name"],
-                  lat=row["Lat"], lon=row["Long"])
-        for _, row in df.iterrows()
+        VenueInfo(team=team, venue=venue, lat=lat, lon=lon)
+        for team, venue, lat, lon in zip(df["Team"], df["Venue Name"], df["Lat"], df["Long"])
     ]
 
 
@@ -128,23 +135,12 @@ def live_seeds():
 @app.get("/api/events")
 def get_events(venue: str, date: str):
     """Return competing (non-NBA) events at a venue on a given date."""
-    NBA_KEYWORDS = [
-        "vs.", "vs ", " at ", " @ ", "nba", "hawks", "celtics", "nets",
-        "hornets", "bulls", "cavaliers", "mavericks", "nuggets", "pistons",
-        "warriors", "rockets", "pacers", "clippers", "lakers", "grizzlies",
-        "heat", "bucks", "timberwolves", "pelicans", "knicks", "thunder",
-        "magic", "76ers", "suns", "trail blazers", "blazers", "kings", "spurs",
-        "raptors", "jazz", "wizards",
-    ]
     try:
-        events_path = os.path.join(DATA_DIR, "nba_playoff_events_2026.csv")
-        df = pd.read_csv(events_path, parse_dates=["date"])
+        df = _load_events_df()
         title_col = "name" if "name" in df.columns else "title"
         d = pd.Timestamp(date)
-        filtered = df[(df["venue"] == venue) & (df["date"] == d)].copy()
-        mask = ~filtered[title_col].str.lower().apply(
-            lambda x: any(kw in str(x) for kw in NBA_KEYWORDS)
-        )
+        filtered = df[(df["venue"] == venue) & (df["date"] == d)]
+        mask = ~filtered[title_col].fillna("").str.contains(NBA_RE)
         names = filtered[mask][title_col].dropna().tolist()
         return {"venue": venue, "date": date, "events": names[:10]}
     except Exception:
@@ -157,19 +153,15 @@ def simulate(req: SimulateRequest):
     west = req.west_seeds
     has_playin = len(east) >= 10 and len(west) >= 10
 
-    # Pre-compute conflict lookup dict (faster than DataFrame.loc in a tight loop)
-    matrix = get_matrix(DATA_DIR)
-    fast_conflict: dict[str, dict[str, float]] = {
-        vname: {
-            d.strftime("%Y-%m-%d"): float(v)
-            for d, v in zip(matrix.columns, matrix.loc[vname].values)
-            if v > 0
-        }
-        for vname in matrix.index
+    # Pre-compute conflict lookup keyed by integer date ordinal, so the
+    # scheduler's candidate probes hash an int instead of formatting a string.
+    fast_conflict: dict[str, dict[int, float]] = {
+        vname: {d.toordinal(): v for d, v in per_date.items()}
+        for vname, per_date in get_lookup(DATA_DIR).items()
     }
 
     def conflict_fn(v: str, d) -> float:
-        return fast_conflict.get(v, {}).get(d.strftime("%Y-%m-%d"), 0.0)
+        return fast_conflict.get(v, {}).get(d.toordinal(), 0.0)
 
     team_venue = get_team_venue()
 
@@ -345,8 +337,16 @@ def stress_test(req: StressTestRequest):
     active_samples = filter_samples(session.samples, session.locked)
     team_venue = get_team_venue()
 
+    # Ordinal-keyed lookup so the per-game probes in the scoring loops below
+    # are two dict hits instead of a get_conflict call with a Timestamp
+    # conversion each time.
+    fast_conflict: dict[str, dict[int, float]] = {
+        vname: {d.toordinal(): v for d, v in per_date.items()}
+        for vname, per_date in get_lookup(DATA_DIR).items()
+    }
+
     def conflict_with_penalty(venue, date, weekend_penalty):
-        base = get_conflict(venue, date, DATA_DIR)
+        base = fast_conflict.get(venue, {}).get(date.toordinal(), 0.0)
         if date.weekday() >= 4:  # Fri=4, Sat=5, Sun=6
             return base * weekend_penalty
         return base
@@ -50,6 +50,52 @@ def _game_venues(home_venue: str, away_venue: str, n_games: int) -> list[str]:
     return pattern[:n_games]
 
 
+def _plan_series_dates(venues, earliest, conflict_fn, lookahead_days):
+    """Assign one date per game minimizing the series' total conflict.
+
+    Exact DP over cumulative slip days: each game may slip 0..lookahead_days
+    past its earliest feasible day, which is fixed by the previous game's date
+    plus rest (+1 travel day on a venue change). The per-game greedy this
+    replaces could lock in a cheap early date that forces expensive later
+    ones; the DP state is tiny (<= 7 games x ~21 slip days), so the optimum
+    is exact and cheap. Returns (dates, scores) per game.
+    """
+    n = len(venues)
+    base = [earliest]
+    for g in range(n - 1):
+        gap = 2 + (1 if venues[g + 1] != venues[g] else 0)
+        base.append(base[-1] + timedelta(days=gap))
+
+    # dp: cumulative slip -> (total conflict, per-game slip offsets)
+    dp: dict[int, tuple[float, list[int]]] = {}
+    for offset in range(lookahead_days + 1):
+        date = base[0] + timedelta(days=offset)
+        dp[offset] = (conflict_fn(venues[0], date), [offset])
+
+    for g in range(1, n):
+        nxt: dict[int, tuple[float, list[int]]] = {}
+        for slip, (total, offsets) in dp.items():
+            for offset in range(lookahead_days + 1):
+                new_slip = slip + offset
+                date = base[g] + timedelta(days=new_slip)
+                cost = total + conflict_fn(venues[g], date)
+                if new_slip not in nxt or cost < nxt[new_slip][0]:
+                    nxt[new_slip] = (cost, offsets + [offset])
+        dp = nxt
+
+    _, best_offsets = min(dp.values(), key=lambda entry: entry[0])
+
+    dates: list[datetime] = []
+    scores: list[float] = []
+    slip = 0
+    for g, offset in enumerate(best_offsets):
+        slip += offset
+        date = base[g] + timedelta(days=slip)
+        dates.append(date)
+        scores.append(conflict_fn(venues[g], date))
+    return dates, scores
+
+
 def schedule_bracket(
     sample: BracketSample,
     team_venue: dict[str, str],
@@ -108,28 +154,16 @@ def schedule_bracket(
             earliest = base + timedelta(days=stagger)
 
             venues = _game_venues(hv, av, n)
-            cur = earliest
-            game_dates: list[datetime] = []
-
-            for g in range(n):
-                venue = venues[g]
-                candidates = [cur + timedelta(days=d) for d in range(lookahead_days + 1)]
-                scores = [conflict_fn(venue, d) for d in candidates]
-                best_idx = int(min(range(len(scores)), key=lambda i: scores[i]))
-                best_date = candidates[best_idx]
-                game_dates.append(best_date)
-
-                c = scores[best_idx]
+            game_dates, game_scores = _plan_series_dates(venues, earliest, conflict_fn, lookahead_days)
+
+            for g, (date, venue, c) in enumerate(zip(game_dates, venues, game_scores)):
                 games.append(ScheduledGame(
                     series_key=key, round=round_num, game_num=g + 1,
                     home=sr.home, away=sr.away,
-                    date=best_date, venue=venue, conflict_score=c,
+                    date=date, venue=venue, conflict_score=c,
                 ))
                 total_conflict += c
 
-                travel = 1 if g + 1 < n and venues[g + 1] != venue else 0
-                cur = best_date + timedelta(days=2 + travel)
-
             round_end_dates[key] = game_dates[-1]
 
     return ScheduledBracket(games=games, total_conflict=total_conflict)
@@ -4,11 +4,13 @@ Use this after modifying filters to regenerate the API events CSV.
 """
 
 import argparse
-import json
 import os
 
+import orjson
 import pandas as pd
 
+from filters import EXCLUDE_RE, build_arena_mask
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Clean cached Ticketmaster events")
@@ -24,98 +26,89 @@ def parse_args():
     return parser.parse_args()
 
 
-def is_nba_arena(venue, nba_arena_names):
-    normalized = str(venue).lower().strip()
-    return any(arena in normalized or normalized in arena for arena in nba_arena_names)
-
-
 def main():
     args = parse_args()
 
     venues_df = pd.read_csv(args.venues_csv)
     nba_arena_names = venues_df["Venue Name"].str.lower().str.strip().tolist()
 
-    all_events = []
-    for _, row in venues_df.iterrows():
-        team = row["Team"]
-        cache_file = os.path.join(args.cache_dir, f"{team.replace(' ', '_')}.json")
-        if not os.path.exists(cache_file):
-            print(f"  MISSING cache: {cache_file}")
-            continue
+    # Prefer the combined cache written by run_api.py (one read for all teams);
+    # fall back to the per-team files for caches from older runs.
+    combined_path = os.path.join(args.cache_dir, "events_all.json")
+    combined = None
+    if os.path.exists(combined_path):
+        with open(combined_path, "rb") as file:
+            combined = orjson.loads(file.read())
 
-        with open(cache_file, "r", encoding="utf-8") as file:
-            venue_events = json.load(file)
+    # ISO date strings compare lexicographically, so out-of-window rows can be
+    # pruned before they are ever materialized into pandas.
+    start_str, end_str = args.start_date, args.end_date
 
+    all_events = []
+    raw_count = 0
+    for team in venues_df["Team"].to_numpy():
+        if combined is not None and team in combined:
+            venue_events = combined[team]
+        else:
+            cache_file = os.path.join(args.cache_dir, f"{team.replace(' ', '_')}.json")
+            if not os.path.exists(cache_file):
+                print(f"  MISSING cache: {cache_file}")
+                continue
+
+            with open(cache_file, "rb") as file:
+                venue_events = orjson.loads(file.read())
+
+        raw_count += len(venue_events)
         for event in venue_events:
-            event["team"] = team
+            date = event.get("date")
+            if date and start_str <= date <= end_str:
+                event["team"] = team
+                all_events.append(event)
 
-        all_events.extend(venue_events)
-
-    print(f"Raw events from cache: {len(all_events)}")
+    print(f"Raw events from cache: {raw_count} ({len(all_events)} in window)")
 
     df = pd.DataFrame(all_events)
     if df.empty:
         print("No cached events found. Nothing to save.")
         return
 
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    # Dedicated string dtype up front, so every downstream .str call runs on
+    # the string kernels instead of object arrays.
+    df = df.astype({"name": "string", "venue": "string"})
+
+    # Explicit format + cache avoids the per-row dateutil fallback on the
+    # uniform ISO dates coming out of the Ticketmaster cache.
+    df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", cache=True, errors="coerce")
 
     start_ts = pd.Timestamp(args.start_date)
     end_ts = pd.Timestamp(args.end_date)
-    df = df[(df["date"] >= start_ts) & (df["date"] <= end_ts)]
-    print(f"After date filter: {len(df)}")
-
-    exclude_kw = [
-        "voucher",
-        "suite pass",
-        "post game",
-        "item",
-        "educator",
-        "access only",
-        "gift",
-        "discount pass",
-        "tour experience",
-        " tour",
-        "arena tour",
-        "deposit",
-        " offer",
-        "testing",
-        "halftime",
-        "prospect deposit",
-        "club deposit",
-        "member offer",
-        "member drop",
-        "add on",
-        "tshirt",
-        "t-shirt",
-        "dream team",
-        "group deposit",
-        "levy ticket",
-        "season ticket",
-    ]
-
-    mask = ~df["name"].str.lower().apply(lambda value: any(keyword in str(value) for keyword in exclude_kw))
-    df = df[mask]
-    print(f"After keyword filter: {len(df)}")
+    date_mask = df["date"].between(start_ts, end_ts).to_numpy()
+    print(f"After date filter: {int(date_mask.sum())}")
+
+    keyword_mask = date_mask & (~df["name"].fillna("").str.contains(EXCLUDE_RE)).to_numpy()
+    print(f"After keyword filter: {int(keyword_mask.sum())}")
 
+    venue_norm = df["venue"].fillna("").str.lower().str.strip()
+    keep_mask = keyword_mask & build_arena_mask(venue_norm.to_numpy(), nba_arena_names)
+    print(f"After same-venue filter: {int(keyword_mask.sum())} -> {int(keep_mask.sum())}")
+
+    # One fused indexing pass instead of materializing a frame per filter step.
     df = (
-        df.drop_duplicates(subset=["team", "date", "time", "venue"])
+        df[keep_mask]
+        .drop_duplicates(subset=["team", "date", "time", "venue"])
         .sort_values(["date", "venue"])
         .reset_index(drop=True)
     )
     print(f"After dedup: {len(df)}")
 
-    before = len(df)
-    df = df[df["venue"].apply(lambda venue: is_nba_arena(venue, nba_arena_names))].reset_index(drop=True)
-    print(f"After same-venue filter: {before} -> {len(df)}")
-
-    df.to_csv(args.output, index=False)
+    # Format dates in one vectorized pass instead of per-cell during to_csv.
+    df.assign(date=df["date"].dt.strftime("%Y-%m-%d")).to_csv(args.output, index=False)
     print(f"\nSaved {len(df)} events to {args.output}")
 
     print("\nEvents per team:")
-    for _, row in venues_df.iterrows():
-        team = row["Team"]
-        team_count = len(df[df["team"] == team])
+    team_counts = df["team"].value_counts()
+    for team in venues_df["Team"].to_numpy():
+        team_count = int(team_counts.get(team, 0))
         if team_count > 0:
             print(f"  {team:35s}  {team_count}")
 
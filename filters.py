@@ -0,0 +1,76 @@
+"""
+Shared event filters for the cleaning pipeline: the exclude-keyword regex and
+the NBA-arena matcher. Built once at import so they are never rebuilt per run
+within a process, and so clean_events.py and run_api.py stay in sync.
+"""
+
+import re
+
+import numpy as np
+
+# Add-on/package listings that are not real events (vouchers, suite passes,
+# arena tours, deposits, ...).
+EXCLUDE_KEYWORDS = [
+    "voucher",
+    "suite pass",
+    "post game",
+    "item",
+    "educator",
+    "access only",
+    "gift",
+    "discount pass",
+    "tour experience",
+    " tour",
+    "arena tour",
+    "deposit",
+    " offer",
+    "testing",
+    "halftime",
+    "prospect deposit",
+    "club deposit",
+    "member offer",
+    "member drop",
+    "add on",
+    "tshirt",
+    "t-shirt",
+    "dream team",
+    "group deposit",
+    "levy ticket",
+    "season ticket",
+]
+
+EXCLUDE_RE = re.compile("|".join(re.escape(keyword) for keyword in EXCLUDE_KEYWORDS), re.IGNORECASE)
+
+
+def _canon(s):
+    """Canonical venue key: lowercase with punctuation/whitespace stripped."""
+    return re.sub(r"[^a-z0-9]+", "", s.lower())
+
+
+def build_arena_mask(venues_norm, nba_arena_names):
+    """Boolean mask: True where a venue string contains (or is contained in) an NBA arena name.
+
+    Expects pre-normalized (lowercased, stripped) venue strings. A single
+    alternation regex scans each venue once instead of looping over all ~30
+    arena names per row, and the decision is made once per distinct venue
+    string — event rows repeat the same handful of venues, so N rows cost
+    K distinct decisions plus one index pass.
+    """
+    arena_set = frozenset(nba_arena_names)
+    arena_canons = frozenset(_canon(name) for name in nba_arena_names)
+    arena_re = re.compile("|".join(re.escape(name) for name in nba_arena_names))
+    unique, inverse = np.unique(np.asarray(venues_norm, dtype=object), return_inverse=True)
+    decisions = np.empty(len(unique), dtype=bool)
+    for i, venue in enumerate(unique):
+        # Ladder from cheap to expensive: exact set membership, then the
+        # punctuation-insensitive canonical key (catches "T.D. Garden"),
+        # then the regex/substring scans for partial matches. Missing
+        # venues (empty after fillna) never match — the reverse
+        # containment rung is vacuously true for "".
+        decisions[i] = bool(venue) and (
+            venue in arena_set
+            or _canon(venue) in arena_canons
+            or arena_re.search(venue) is not None
+            or any(venue in arena for arena in nba_arena_names)
+        )
+    return decisions[inverse]
@@ -11,9 +11,11 @@ Troubleshooting notes (updated after live DOM inspection):
 import argparse
 import os, sys, time, re
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -23,6 +25,48 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 
+def _class_xpath(tag, cls):
+    """XPath step matching a class token (the lxml equivalent of 'tag.cls')."""
+    return f'{tag}[contains(concat(" ", normalize-space(@class), " "), " {cls} ")]'
+
+
+# Precompiled XPath selectors for the Barclays/Spectrum month pages; compiled
+# once at import instead of per month parse.
+EVENT_WRAPPER_XPATH = etree.XPath("//" + _class_xpath("div", "event_item_wrapper"))
+BARCLAYS_DATE_XPATH = etree.XPath(f'.//{_class_xpath("div", "date")}//{_class_xpath("span", "dt")}')
+BARCLAYS_TIME_XPATH = etree.XPath(f'.//{_class_xpath("span", "time")}')
+TITLE_LINK_XPATH = etree.XPath(".//h3//a")
+SPECTRUM_DATE_XPATH = etree.XPath(
+    f'.//{_class_xpath("div", "info")}//{_class_xpath("*", "date")}//{_class_xpath("*", "dt")}'
+)
+SPECTRUM_TIME_XPATH = etree.XPath(
+    f'.//{_class_xpath("div", "info")}//{_class_xpath("*", "date")}//{_class_xpath("*", "time")}'
+)
+SPECTRUM_MONTH_XPATH = etree.XPath(
+    '//h2[@id="cal-month"] | //' + _class_xpath("*", "cal-month") + " | //" + _class_xpath("h2", "month-year")
+)
+
+
+def _first_text(elements):
+    return elements[0].text_content().strip() if elements else ""
+
+
+# Selenium locators and date formats used in the scrape loops, named once at
+# module scope instead of rebuilt per iteration.
+MONTH_NAME_CSS = "div.month_name"
+MONTH_NAME_SEL = (By.CSS_SELECTOR, MONTH_NAME_CSS)
+CAL_NEXT_SEL = (By.CSS_SELECTOR, "div.cal-next")
+BARCLAYS_MONTH_CSS = ".cal-month"
+BARCLAYS_MONTH_SEL = (By.CLASS_NAME, "cal-month")
+BARCLAYS_NEXT_SEL = (By.CLASS_NAME, "cal-next")
+SPECTRUM_MONTH_CSS = "h2#cal-month, .cal-month, h2.month-year"
+SPECTRUM_NEXT_SELECTORS = (".cal-next", "a.next", "button.next-month", "div.cal-next")
+MONTH_HEADER_FMT = "%B %Y"
+FULLDATE_FMT = "%m-%d-%Y"          # State Farm / TD Garden data-fulldate
+BARCLAYS_DATE_FMT = "%b %d, %Y"
+BARCLAYS_DATE_FMT_FULL = "%B %d, %Y"
+
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Run NBA venue scrapers for a playoff window")
     parser.add_argument("--start-date", default=os.getenv("PLAYOFF_START", "2026-04-14"), help="YYYY-MM-DD")
@@ -35,7 +79,7 @@ def parse_args():
     return parser.parse_args()
 
 # ── Driver factory ────────────────────────────────────────────────────────────
-def setup_driver():
+def setup_driver(driver_path):
     options = webdriver.ChromeOptions()
     options.add_argument("--headless")
     options.add_argument("--disable-gpu")
@@ -44,49 +88,118 @@ def setup_driver():
     options.add_argument("--log-level=3")
     options.add_argument("--window-size=1920,1080")
     options.add_experimental_option("excludeSwitches", ["enable-logging"])
-    service = Service(ChromeDriverManager().install(), log_path=os.devnull)
+    service = Service(driver_path, log_path=os.devnull)
     return webdriver.Chrome(options=options, service=service)
 
 
 # ── Shared: read current month from div.month_name, click div.cal-next ────────
+def _parse_month_header(text):
+    """'April 2026' (any case) -> datetime, or None."""
+    try:
+        return datetime.strptime(text.strip().title(), MONTH_HEADER_FMT)
+    except (AttributeError, ValueError):
+        return None
+
+
 def get_month_year(driver, timeout=8):
     """Return current calendar datetime from div.month_name, or None."""
     try:
         el = WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.month_name"))
+            EC.presence_of_element_located(MONTH_NAME_SEL)
         )
-        return datetime.strptime(el.text.strip(), "%B %Y")
+        return _parse_month_header(el.text)
+    except Exception:
+        return None
+
+
+def _read_header_text(driver, selector):
+    try:
+        return driver.find_element(By.CSS_SELECTOR, selector).text.strip()
     except Exception:
         return None
 
 
+def _wait_for_header_change(driver, selector, prev_text, timeout=5):
+    """Wait until the calendar header text differs from prev_text.
+
+    Calendar transitions typically finish in well under a second, so waiting
+    on the header beats the flat 2 s sleep it replaces. Falls back to the old
+    sleep when the header could not be read before clicking, and times out
+    quietly when a site re-renders without changing the header.
+    """
+    if prev_text is None:
+        time.sleep(2)
+        return
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: _read_header_text(d, selector) not in (prev_text, None)
+        )
+    except TimeoutException:
+        pass
+
+
 def click_next_month(driver, timeout=5):
-    """Click the div.cal-next button (a div with role=button, not an <a>)."""
+    """Click the div.cal-next button (a div with role=button, not an <a>).
+
+    Returns the parsed post-click month (the header was just read for the
+    change wait, so callers need no extra round-trip), True if the click
+    landed but the header could not be parsed, or False on failure.
+    """
     try:
         btn = WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.cal-next"))
+            EC.presence_of_element_located(CAL_NEXT_SEL)
         )
+        prev_text = _read_header_text(driver, MONTH_NAME_CSS)
         driver.execute_script("arguments[0].click();", btn)
-        time.sleep(2)
-        return True
+        _wait_for_header_change(driver, MONTH_NAME_CSS, prev_text, timeout)
+        return _parse_month_header(_read_header_text(driver, MONTH_NAME_CSS)) or True
     except Exception:
         return False
 
 
+def rows_in_window(venue_name, raw_rows, date_format, start_date, end_date):
+    """Batch-parse (date_str, title, time, link) rows and keep those in the window.
+
+    One vectorized pd.to_datetime call (with its internal string cache)
+    replaces a datetime.strptime + try/except per event.
+    """
+    if not raw_rows:
+        return []
+    dates = pd.to_datetime(
+        pd.Series([r[0] for r in raw_rows]), format=date_format, errors="coerce", cache=True
+    )
+    mask = dates.between(start_date, end_date).to_numpy()
+    return [
+        {
+            "Venue": venue_name, "Title": title,
+            "Date": date.strftime("%Y-%m-%d"), "Time": etime, "Link": link,
+        }
+        for keep, date, (_, title, etime, link) in zip(mask, dates, raw_rows)
+        if keep
+    ]
+
+
 def navigate_to_month(driver, target_month, max_clicks=8):
-    """Advance calendar forward until we reach target_month (datetime)."""
+    """Advance calendar forward until we reach target_month (datetime).
+
+    Returns the month the calendar ends on (or None if unreadable), reusing
+    the header parsed by click_next_month so each step reads the header once.
+    """
+    cur = get_month_year(driver)
     for _ in range(max_clicks):
-        cur = get_month_year(driver)
         if cur is None:
             print("  Warning: could not read current month")
-            return
+            return None
         if cur >= target_month:
-            return
+            return cur
         print(f"  Navigating: {cur.strftime('%B %Y')} -> next")
-        if not click_next_month(driver):
+        clicked = click_next_month(driver)
+        if not clicked:
             print("  No next button found during navigation")
-            return
+            return cur
+        cur = clicked if isinstance(clicked, datetime) else get_month_year(driver)
     print("  Reached max navigation clicks")
+    return cur
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -95,17 +208,16 @@ def navigate_to_month(driver, target_month, max_clicks=8):
 def scrape_state_farm(driver, venue_name, url, start_date, end_date):
     print(f"\n{'='*60}")
     print(f"Scraping: {venue_name}  ({url})")
-    events_data = []
+    raw_rows = []
 
     driver.get(url)
     time.sleep(3)
 
     # Navigate to start month
-    navigate_to_month(driver, start_date.replace(day=1))
+    cur = navigate_to_month(driver, start_date.replace(day=1))
 
     # Scrape month by month through the window
     while True:
-        cur = get_month_year(driver)
         if cur is None:
             print("  Could not read month — stopping")
             break
@@ -121,9 +233,6 @@ def scrape_state_farm(driver, venue_name, url, start_date, end_date):
                 date_str = event.get_attribute("data-fulldate")
                 if not date_str:
                     continue
-                event_date = datetime.strptime(date_str, "%m-%d-%Y")
-                if not (start_date <= event_date <= end_date):
-                    continue
 
                 try:
                     event_desc = event.find_element(By.CLASS_NAME, "desc")
@@ -135,17 +244,17 @@ def scrape_state_farm(driver, venue_name, url, start_date, end_date):
                 except Exception:
                     title, link, etime = "Unknown", "", "TBA"
 
-                events_data.append({
-                    "Venue": venue_name, "Title": title,
-                    "Date":  event_date.strftime("%Y-%m-%d"), "Time": etime, "Link": link,
-                })
+                raw_rows.append((date_str, title, etime, link))
             except Exception as e:
                 print(f"  Event error: {e}")
 
-        if not click_next_month(driver):
+        clicked = click_next_month(driver)
+        if not clicked:
             print("  No next button — done")
             break
+        cur = clicked if isinstance(clicked, datetime) else get_month_year(driver)
 
+    events_data = rows_in_window(venue_name, raw_rows, FULLDATE_FMT, start_date, end_date)
     print(f"  Total collected: {len(events_data)} events")
     return events_data
 
@@ -156,15 +265,14 @@ def scrape_state_farm(driver, venue_name, url, start_date, end_date):
 def scrape_td_garden(driver, venue_name, url, start_date, end_date):
     print(f"\n{'='*60}")
     print(f"Scraping: {venue_name}  ({url})")
-    events_data = []
+    raw_rows = []
 
     driver.get(url)
     time.sleep(3)
 
-    navigate_to_month(driver, start_date.replace(day=1))
+    cur = navigate_to_month(driver, start_date.replace(day=1))
 
     while True:
-        cur = get_month_year(driver)
         if cur is None:
             print("  Could not read month — stopping")
             break
@@ -180,9 +288,6 @@ def scrape_td_garden(driver, venue_name, url, start_date, end_date):
                 date_str = event.get_attribute("data-fulldate")
                 if not date_str:
                     continue
-                event_date = datetime.strptime(date_str, "%m-%d-%Y")
-                if not (start_date <= event_date <= end_date):
-                    continue
 
                 try:
                     desc = event.find_element(By.CLASS_NAME, "desc")
@@ -197,17 +302,17 @@ def scrape_td_garden(driver, venue_name, url, start_date, end_date):
                 except Exception:
                     etime = "TBA"
 
-                events_data.append({
-                    "Venue": venue_name, "Title": title,
-                    "Date":  event_date.strftime("%Y-%m-%d"), "Time": etime, "Link": link,
-                })
+                raw_rows.append((date_str, title, etime, link))
             except Exception as e:
                 print(f"  Event error: {e}")
 
-        if not click_next_month(driver):
+        clicked = click_next_month(driver)
+        if not clicked:
             print("  No next button — done")
             break
+        cur = clicked if isinstance(clicked, datetime) else get_month_year(driver)
 
+    events_data = rows_in_window(venue_name, raw_rows, FULLDATE_FMT, start_date, end_date)
     print(f"  Total collected: {len(events_data)} events")
     return events_data
 
@@ -228,48 +333,54 @@ def scrape_barclays(driver, venue_name, url, start_date, end_date):
         """Barclays uses .cal-month with text like 'APRIL 2026'."""
         try:
             el = WebDriverWait(driver, 8).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "cal-month"))
+                EC.presence_of_element_located(BARCLAYS_MONTH_SEL)
             )
-            txt = el.text.strip()  # e.g. "APRIL 2026"
-            return datetime.strptime(txt.title(), "%B %Y")
+            return _parse_month_header(el.text)
         except Exception:
             return None
 
     def click_barclays_next(driver):
+        """Click next; returns the parsed post-click month, True, or False
+        (same contract as click_next_month)."""
         try:
             btn = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "cal-next"))
+                EC.presence_of_element_located(BARCLAYS_NEXT_SEL)
             )
+            prev_text = _read_header_text(driver, BARCLAYS_MONTH_CSS)
             driver.execute_script("arguments[0].click();", btn)
-            time.sleep(2)
-            return True
+            _wait_for_header_change(driver, BARCLAYS_MONTH_CSS, prev_text)
+            return _parse_month_header(_read_header_text(driver, BARCLAYS_MONTH_CSS)) or True
         except Exception:
             return False
 
     def parse_barclays_date(raw):
-        """Parse 'Feb 1, 2026 -' or 'Feb 1, 2026' → datetime or None."""
-        raw = raw.strip().rstrip(" -").strip()
+        """Parse 'Feb 1, 2026 -', 'Feb. 1, 2026' or 'February 1, 2026' → datetime or None.
+
+        Normalizing once (trailing dash, periods) leaves only the abbreviated
+        vs full month-name split, so the common case is a single strptime
+        instead of exception-driven retries over a format list.
+        """
+        raw = raw.strip().rstrip(" -").replace(".", "").strip()
         if not raw:
             return None
-        for fmt in ["%b %d, %Y", "%B %d, %Y", "%b. %d, %Y"]:
+        try:
+            return datetime.strptime(raw, BARCLAYS_DATE_FMT)
+        except ValueError:
             try:
-                return datetime.strptime(raw, fmt)
+                return datetime.strptime(raw, BARCLAYS_DATE_FMT_FULL)
             except ValueError:
-                continue
-        return None
+                return None
 
     # Navigate from current month to April 2026
+    cur = get_barclays_month(driver)
     for _ in range(10):
-        cur = get_barclays_month(driver)
-        if cur is None:
-            break
-        if cur >= start_date.replace(day=1):
+        if cur is None or cur >= start_date.replace(day=1):
             break
         print(f"  Navigating: {cur.strftime('%B %Y')} -> next")
-        click_barclays_next(driver)
+        clicked = click_barclays_next(driver)
+        cur = clicked if isinstance(clicked, datetime) else get_barclays_month(driver)
 
     while True:
-        cur = get_barclays_month(driver)
         if cur is None:
             print("  Could not read Barclays month — stopping")
             break
@@ -277,27 +388,25 @@ def scrape_barclays(driver, venue_name, url, start_date, end_date):
         if cur > end_date.replace(day=1):
             break
 
-        # Use BeautifulSoup on page source for reliable parsing
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        wrappers = soup.select("div.event_item_wrapper")
+        # Parse the page source once per month with lxml + precompiled XPath
+        tree = lxml.html.fromstring(driver.page_source)
+        wrappers = EVENT_WRAPPER_XPATH(tree)
         print(f"  Found {len(wrappers)} event wrappers")
 
         for wrapper in wrappers:
             try:
-                date_el = wrapper.select_one("div.date span.dt")
-                raw_date = date_el.get_text(strip=True) if date_el else ""
+                raw_date = _first_text(BARCLAYS_DATE_XPATH(wrapper))
                 event_date = parse_barclays_date(raw_date)
                 if event_date is None:
                     continue
                 if not (start_date <= event_date <= end_date):
                     continue
 
-                title_el = wrapper.select_one("h3 a")
-                title = title_el.get_text(strip=True) if title_el else "Unknown"
-                link  = title_el.get("href", "") if title_el else ""
+                title_els = TITLE_LINK_XPATH(wrapper)
+                title = _first_text(title_els) or "Unknown"
+                link  = title_els[0].get("href", "") if title_els else ""
 
-                time_el = wrapper.select_one("div.date span.time, span.time")
-                etime = time_el.get_text(strip=True) if time_el else "TBA"
+                etime = _first_text(BARCLAYS_TIME_XPATH(wrapper)) or "TBA"
 
                 events_data.append({
                     "Venue": venue_name, "Title": title,
@@ -306,9 +415,11 @@ def scrape_barclays(driver, venue_name, url, start_date, end_date):
             except Exception as e:
                 print(f"  Event parse error: {e}")
 
-        if not click_barclays_next(driver):
+        clicked = click_barclays_next(driver)
+        if not clicked:
             print("  No next button — done")
             break
+        cur = clicked if isinstance(clicked, datetime) else get_barclays_month(driver)
 
     print(f"  Total collected: {len(events_data)} events")
     return events_data
@@ -325,25 +436,24 @@ def scrape_spectrum(driver, venue_name, url, start_date, end_date):
     driver.get(url)
     time.sleep(3)
 
-    def get_spectrum_month(soup):
-        el = (soup.select_one("h2#cal-month") or
-              soup.select_one(".cal-month") or
-              soup.select_one("h2.month-year"))
-        if el:
+    def get_spectrum_month(tree):
+        text = _first_text(SPECTRUM_MONTH_XPATH(tree))
+        if text:
             try:
-                return datetime.strptime(el.get_text(strip=True), "%B %Y")
+                return datetime.strptime(text, MONTH_HEADER_FMT)
             except ValueError:
                 return None
         return None
 
     def click_spectrum_next(driver):
-        for sel in [".cal-next", "a.next", "button.next-month", "div.cal-next"]:
+        for sel in SPECTRUM_NEXT_SELECTORS:
             try:
                 btn = WebDriverWait(driver, 5).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, sel))
                 )
+                prev_text = _read_header_text(driver, SPECTRUM_MONTH_CSS)
                 driver.execute_script("arguments[0].click();", btn)
-                time.sleep(2)
+                _wait_for_header_change(driver, SPECTRUM_MONTH_CSS, prev_text)
                 return True
             except Exception:
                 continue
@@ -351,8 +461,8 @@ def scrape_spectrum(driver, venue_name, url, start_date, end_date):
 
     # Navigate to start month
     for _ in range(10):
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        cur = get_spectrum_month(soup)
+        tree = lxml.html.fromstring(driver.page_source)
+        cur = get_spectrum_month(tree)
         if cur is None or cur >= start_date.replace(day=1):
             break
         print(f"  Navigating: {cur.strftime('%B %Y')} -> next")
@@ -360,8 +470,8 @@ def scrape_spectrum(driver, venue_name, url, start_date, end_date):
             break
 
     for _ in range(6):  # max 6 months
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        cur = get_spectrum_month(soup)
+        tree = lxml.html.fromstring(driver.page_source)
+        cur = get_spectrum_month(tree)
         if cur is None:
             print("  No month found — stopping")
             break
@@ -369,22 +479,22 @@ def scrape_spectrum(driver, venue_name, url, start_date, end_date):
         if cur > end_date.replace(day=1):
             break
 
-        wrappers = soup.select("div.event_item_wrapper")
+        wrappers = EVENT_WRAPPER_XPATH(tree)
         print(f"  Found {len(wrappers)} event wrappers")
 
         for wrapper in wrappers:
             try:
-                date_tag = wrapper.select_one("div.info .date .dt")
-                time_tag = wrapper.select_one("div.info .date .time")
-                if not date_tag:
+                raw_date = _first_text(SPECTRUM_DATE_XPATH(wrapper))
+                if not raw_date:
                     continue
-                event_date = datetime.strptime(date_tag.get_text(strip=True), "%b %d, %Y").date()
+                event_date = datetime.strptime(raw_date, BARCLAYS_DATE_FMT).date()
                 if not (start_date.date() <= event_date <= end_date.date()):
                     continue
-                etime = time_tag.get_text(strip=True).lstrip("- ").strip() if time_tag else "TBA"
-                title_tag = wrapper.select_one("h3 a")
-                title = title_tag.get_text(strip=True) if title_tag else "Untitled"
-                link  = urljoin(url, title_tag["href"]) if title_tag and title_tag.get("href") else ""
+                raw_time = _first_text(SPECTRUM_TIME_XPATH(wrapper))
+                etime = raw_time.lstrip("- ").strip() if raw_time else "TBA"
+                title_els = TITLE_LINK_XPATH(wrapper)
+                title = _first_text(title_els) or "Untitled"
+                link  = urljoin(url, title_els[0].get("href")) if title_els and title_els[0].get("href") else ""
                 results.append({
                     "Venue": venue_name, "Title": title,
                     "Date":  event_date.strftime("%Y-%m-%d"), "Time": etime, "Link": link,
@@ -415,6 +525,10 @@ def scrape_united_center(driver, venue_name, url, start_date, end_date):
     return []
 
 
+# Known-blocked: no point booting a Chrome instance just to print the skip note.
+scrape_united_center.requires_driver = False
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN RUNNER
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -439,32 +553,50 @@ def main():
     all_results = []
     summary = {}
 
-    for venue_name, url, fn in SCRAPERS:
-        driver = setup_driver()
+    # Resolve (and on a cold cache, download) chromedriver once before the
+    # pool fans out: webdriver-manager does no locking, so concurrent
+    # install() calls race on the same destination path.
+    driver_path = ChromeDriverManager().install()
+
+    # Each scraper spends most of its wall time waiting on page loads and
+    # month transitions, so the venues run in parallel threads with one
+    # Chrome driver apiece; total runtime approaches the slowest venue
+    # instead of the sum of all five.
+    def run_one(spec):
+        venue_name, url, fn = spec
+        driver = setup_driver(driver_path) if getattr(fn, "requires_driver", True) else None
         try:
-            events = fn(driver, venue_name, url, start_date, end_date)
-            all_results.extend(events)
-            summary[venue_name] = {"status": "OK", "count": len(events)}
+            return venue_name, fn(driver, venue_name, url, start_date, end_date), None
         except Exception as e:
             print(f"\nFATAL ERROR for {venue_name}: {e}")
             import traceback; traceback.print_exc()
-            summary[venue_name] = {"status": f"FAILED: {e}", "count": 0}
+            return venue_name, [], e
         finally:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
+    with ThreadPoolExecutor(max_workers=len(SCRAPERS)) as executor:
+        for venue_name, events, error in executor.map(run_one, SCRAPERS):
+            all_results.extend(events)
+            if error is None:
+                summary[venue_name] = {"status": "OK", "count": len(events)}
+            else:
+                summary[venue_name] = {"status": f"FAILED: {error}", "count": 0}
 
     # Save
     if all_results:
         df = pd.DataFrame(all_results)
-        df["Date"] = pd.to_datetime(df["Date"])
+        df["Date"] = pd.to_datetime(df["Date"], format="%Y-%m-%d", cache=True)
         df = (df.drop_duplicates(subset=["Venue", "Title", "Date"])
                 .sort_values(["Date", "Venue"])
                 .reset_index(drop=True))
-        df.to_csv(args.output, index=False)
+        # Format dates in one vectorized pass instead of per-cell during to_csv.
+        df.assign(Date=df["Date"].dt.strftime("%Y-%m-%d")).to_csv(args.output, index=False)
         print(f"\nSaved {len(df)} events to {args.output}")
-        print(df.groupby("Venue").size().to_string())
+        print(df["Venue"].value_counts().sort_index().to_string())
     else:
         print("\nNo events collected.")
 
@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from filters import EXCLUDE_RE, build_arena_mask  # noqa: E402
+
+
+def test_exclude_regex_matches_known_junk():
+    assert EXCLUDE_RE.search("Arena Tour Experience")
+    assert EXCLUDE_RE.search("SUITE PASS - Playoffs")
+    assert EXCLUDE_RE.search("Season Ticket Member Offer")
+    assert not EXCLUDE_RE.search("Big Concert Night")
+
+
+def test_arena_mask_matches_both_directions():
+    arenas = ["td garden", "state farm arena"]
+    venues = ["td garden", "td garden (boston)", "garden", "somewhere else"]
+    assert build_arena_mask(venues, arenas).tolist() == [True, True, True, False]
+
+
+def test_arena_mask_ignores_punctuation_differences():
+    arenas = ["td garden"]
+    venues = ["t.d. garden", "td  garden", "boston garden"]
+    assert build_arena_mask(venues, arenas).tolist() == [True, True, False]
+
+
+def test_arena_mask_rejects_missing_venue():
+    arenas = ["td garden"]
+    venues = ["", "td garden"]
+    assert build_arena_mask(venues, arenas).tolist() == [False, True]
@@ -5,11 +5,32 @@ Output: validation_report.txt + validation_detail.csv
 """
 
 import argparse
+import re
 import unicodedata
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
+# Every codepoint with a nonzero combining class (built from the real
+# Unicode property, not a hand-picked block list — Hebrew niqqud, Arabic
+# harakat, kana voicing marks etc. live outside the Latin blocks), so one
+# str.translate pass deletes all NFKD combining marks without a
+# per-character combining() call. Built lazily: most runs never see a
+# non-ASCII title and skip the ~1M-codepoint scan entirely.
+_combining_table = None
+
+
+def _get_combining_table():
+    global _combining_table
+    if _combining_table is None:
+        _combining_table = dict.fromkeys(
+            codepoint for codepoint in range(0x110000) if unicodedata.combining(chr(codepoint))
+        )
+    return _combining_table
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Validate Ticketmaster API data against scraper data")
@@ -25,22 +46,154 @@ def parse_args():
     )
     parser.add_argument("--report-out", default="validation_report.txt", help="Text report output path")
     parser.add_argument("--detail-out", default="validation_detail.csv", help="Detailed CSV output path")
+    parser.add_argument("--quiet", action="store_true", help="Skip echoing the report to stdout")
     return parser.parse_args()
 
 
+@lru_cache(maxsize=100_000)
 def normalize(value):
-    """Lowercase, strip whitespace, and remove diacritics (e.g. 'í' -> 'i')."""
+    """Lowercase, strip whitespace, and remove diacritics (e.g. 'í' -> 'i').
+
+    Cached so each distinct event title pays the NFKD decomposition once;
+    callers pass str(...) so NaN floats hash consistently.
+    """
     normalized = str(value).lower().strip()
-    return "".join(
-        character for character in unicodedata.normalize("NFKD", normalized) if not unicodedata.combining(character)
+    # Most event titles are pure ASCII, which has no diacritics to strip —
+    # skip the NFKD machinery entirely for them.
+    if normalized.isascii():
+        return normalized
+    return unicodedata.normalize("NFKD", normalized).translate(_get_combining_table())
+
+
+def fuzzy_match(name, candidates, threshold=0.8):
+    """True if any candidate is similar to name (SequenceMatcher ratio >= threshold).
+
+    Last rung after the exact-prefix rules: catches retitled listings like
+    'The Eagles' vs 'Eagles - The Long Goodbye'. The quick-ratio upper
+    bounds prune most candidates before the full alignment runs, and the
+    candidate lists are already date-blocked, so this stays near-linear.
+    """
+    matcher = SequenceMatcher()
+    matcher.set_seq2(name)
+    for candidate in candidates:
+        matcher.set_seq1(candidate)
+        if (
+            matcher.real_quick_ratio() >= threshold
+            and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold
+        ):
+            return True
+    return False
+
+
+def process_venue(venue_name, api_v, scr_v):
+    """Match one venue's scraper rows against its API rows.
+
+    Self-contained so venues can run in parallel: returns the venue's
+    report lines plus its detail columns (dates, raw names, matched
+    flags), or Nones for the columns when there is nothing to match.
+    """
+    lines = []
+    lines.append(f"\n{'-' * 60}")
+    lines.append(f"Venue: {venue_name}")
+    lines.append(f"{'-' * 60}")
+
+    lines.append(f"  API events:     {len(api_v)}")
+    lines.append(f"  Scraper events: {len(scr_v)}")
+
+    if scr_v.empty:
+        lines.append("  No scraper events, skipping match analysis")
+        return lines, None, None, None
+
+    matched_count = 0
+    unmatched = []
+
+    # Dense datetime64[D] day numbers instead of .dt.date: no per-row
+    # Python date object, and the day window is plain integer arithmetic.
+    api_days_d64 = api_v["date"].to_numpy().astype("datetime64[D]")
+    api_days = api_days_d64.astype("int64")
+    scr_days_d64 = scr_v["date"].to_numpy().astype("datetime64[D]")
+    scr_days = scr_days_d64.astype("int64")
+
+    # Fixed-width prefix arrays: the 6-/8-char prefix rules run as a few
+    # broadcast C kernels over every (scraper, api) pair in the +/-1 day
+    # window, instead of slicing strings inside nested Python loops. Only
+    # rows those kernels leave unmatched fall through to the fuzzy pass.
+    api_names = np.asarray([normalize(str(name)) for name in api_v["name"].to_numpy()], dtype=np.str_)
+    scr_names_raw = scr_v["name"].to_numpy()
+    scr_names = np.asarray([normalize(str(name)) for name in scr_names_raw], dtype=np.str_)
+
+    api_pref6 = api_names.astype("<U6")
+    api_pref8 = api_names.astype("<U8")
+    scr_pref6 = scr_names.astype("<U6")
+    scr_pref8 = scr_names.astype("<U8")
+    api_lens = np.char.str_len(api_names)
+    scr_lens = np.char.str_len(scr_names)
+
+    day_ok = np.abs(scr_days[:, None] - api_days[None, :]) <= 1
+    prefix_eq = (scr_pref6[:, None] == api_pref6[None, :]) & (scr_lens > 0)[:, None] & (api_lens > 0)[None, :]
+    contains = ((scr_lens > 4)[:, None] & (np.char.find(api_names[None, :], scr_pref8[:, None]) >= 0)) | (
+        (api_lens > 4)[None, :] & (np.char.find(scr_names[:, None], api_pref8[None, :]) >= 0)
     )
+    matched_mask = (day_ok & (prefix_eq | contains)).any(axis=1)
+
+    # Each api name is inserted under d-1, d, and d+1 up front, so the
+    # fuzzy fallback costs one integer dict lookup per unmatched row
+    # instead of re-masking the full api arrays.
+    fuzzy_candidates = {}
+    for day, aname in zip(api_days, api_names):
+        for offset in (-1, 0, 1):
+            fuzzy_candidates.setdefault(day + offset, []).append(aname)
+
+    matched_flags = np.zeros(len(scr_v), dtype=bool)
+    for i, (sday, sdate) in enumerate(zip(scr_days, scr_days_d64)):
+        found = bool(matched_mask[i])
+        if not found:
+            found = fuzzy_match(scr_names[i], fuzzy_candidates.get(sday, ()))
+
+        if found:
+            matched_count += 1
+        else:
+            unmatched.append((sdate, scr_names_raw[i]))
+
+        matched_flags[i] = found
+
+    pct = matched_count / len(scr_v) * 100 if scr_v.shape[0] > 0 else 0
+    lines.append(f"  Matched in API: {matched_count}/{len(scr_v)} ({pct:.0f}%)")
+
+    if unmatched:
+        lines.append("  Scraper-only events (not found in API):")
+        for udate, uname in unmatched:
+            lines.append(f"    {udate}  {uname}")
+
+    # np.unique first: scrapers list several events per date, and np.isin
+    # only needs the distinct days for its sorted membership test.
+    api_only_mask = ~np.isin(api_days, np.unique(scr_days))
+    api_only_count = int(api_only_mask.sum())
+    if api_only_count:
+        lines.append(f"  API-only events on dates not in scraper ({api_only_count}):")
+        for adate, aname in zip(
+            api_days_d64[api_only_mask][:10], api_v["name"].to_numpy()[api_only_mask][:10]
+        ):
+            lines.append(f"    {adate}  {str(aname)[:60]}")
+        if api_only_count > 10:
+            lines.append(f"    ... and {api_only_count - 10} more")
+
+    return lines, scr_days_d64, scr_names_raw, matched_flags
 
 
 def main():
     args = parse_args()
 
-    api_df = pd.read_csv(args.api_csv, parse_dates=["date"])
-    scr_df = pd.read_csv(args.scraper_csv, parse_dates=["Date"])
+    # Dedicated string dtype at read time, as in clean_events.py: the venue
+    # grouping and any .str calls run on string kernels rather than object
+    # arrays holding one PyObject per cell.
+    api_df = pd.read_csv(
+        args.api_csv, parse_dates=["date"], dtype={"name": "string", "venue": "string"}
+    )
+    scr_df = pd.read_csv(
+        args.scraper_csv, parse_dates=["Date"], dtype={"Title": "string", "Venue": "string"}
+    )
 
     scr_df = scr_df.rename(columns={"Title": "name", "Date": "date", "Time": "time", "Venue": "venue"})
 
@@ -52,8 +205,29 @@ def main():
         # United Center intentionally skipped (Cloudflare blocking)
     ]
 
+    # One grouping pass per frame instead of a per-venue str.contains scan:
+    # each row's venue is matched against the scraper-venue alternation once
+    # and the frames are split by the canonical name.
+    venue_pattern = "(" + "|".join(re.escape(name) for name in scraper_venues) + ")"
+    canonical = {name.lower(): name for name in scraper_venues}
+
+    def group_by_scraper_venue(df):
+        matched = df["venue"].str.extract(venue_pattern, flags=re.IGNORECASE)[0].str.lower().map(canonical)
+        return dict(tuple(df.groupby(matched)))
+
+    api_groups = group_by_scraper_venue(api_df)
+    scr_groups = group_by_scraper_venue(scr_df)
+
     lines = []
-    detail_rows = []
+
+    # Preallocated detail columns (one slot per scraper row, trimmed at the
+    # end): the final DataFrame adopts the arrays directly instead of
+    # rebuilding them from a list of per-row tuples.
+    out_venue = np.empty(len(scr_df), dtype=object)
+    out_date = np.empty(len(scr_df), dtype="datetime64[D]")
+    out_name = np.empty(len(scr_df), dtype=object)
+    out_matched = np.zeros(len(scr_df), dtype=bool)
+    out_i = 0
 
     lines.append("=" * 70)
     lines.append("VALIDATION REPORT: Ticketmaster API vs. Venue Scrapers")
@@ -61,82 +235,30 @@ def main():
     lines.append(f"Scraper events total: {len(scr_df)} ({len(scraper_venues)} venues)")
     lines.append("=" * 70)
 
-    for venue_name in scraper_venues:
-        lines.append(f"\n{'-' * 60}")
-        lines.append(f"Venue: {venue_name}")
-        lines.append(f"{'-' * 60}")
-
-        api_v = api_df[api_df["venue"].str.contains(venue_name, case=False, na=False)].copy()
-        scr_v = scr_df[scr_df["venue"].str.contains(venue_name, case=False, na=False)].copy()
-
-        lines.append(f"  API events:     {len(api_v)}")
-        lines.append(f"  Scraper events: {len(scr_v)}")
-
-        if scr_v.empty:
-            lines.append("  No scraper events, skipping match analysis")
+    # Each venue only reads its own slices, so the venue loop fans out
+    # across a thread pool (same pattern as run_api.py / run_scrapers.py);
+    # pool.map keeps the results in venue order for the report and detail
+    # stitching below.
+    def run_venue(venue_name):
+        return process_venue(
+            venue_name,
+            api_groups.get(venue_name, api_df.iloc[0:0]),
+            scr_groups.get(venue_name, scr_df.iloc[0:0]),
+        )
+
+    with ThreadPoolExecutor(max_workers=len(scraper_venues)) as pool:
+        results = list(pool.map(run_venue, scraper_venues))
+
+    for venue_name, (venue_lines, dates_d64, names_raw, matched_flags) in zip(scraper_venues, results):
+        lines.extend(venue_lines)
+        if dates_d64 is None:
             continue
-
-        matched = []
-        unmatched = []
-
-        api_by_date = {}
-        for _, row in api_v.iterrows():
-            event_date = row["date"].date()
-            api_by_date.setdefault(event_date, []).append(normalize(row["name"]))
-
-        for _, srow in scr_v.iterrows():
-            sdate = srow["date"].date()
-            sname = normalize(srow["name"])
-
-            found = False
-            for delta in [0, 1, -1]:
-                check_date = sdate + timedelta(days=delta)
-                api_names = api_by_date.get(check_date, [])
-
-                for aname in api_names:
-                    short_s = sname[:6]
-                    short_a = aname[:6]
-                    if (
-                        (short_s and short_a and short_s == short_a)
-                        or (len(sname) > 4 and sname[:8] in aname)
-                        or (len(aname) > 4 and aname[:8] in sname)
-                    ):
-                        found = True
-                        break
-
-                if found:
-                    break
-
-            if found:
-                matched.append(srow)
-            else:
-                unmatched.append(srow)
-
-            detail_rows.append(
-                {
-                    "venue": venue_name,
-                    "date": srow["date"].date(),
-                    "scraper_name": srow["name"],
-                    "matched_in_api": found,
-                }
-            )
-
-        pct = len(matched) / len(scr_v) * 100 if scr_v.shape[0] > 0 else 0
-        lines.append(f"  Matched in API: {len(matched)}/{len(scr_v)} ({pct:.0f}%)")
-
-        if unmatched:
-            lines.append("  Scraper-only events (not found in API):")
-            for row in unmatched:
-                lines.append(f"    {row['date'].date()}  {row['name']}")
-
-        scr_dates = set(scr_v["date"].dt.date)
-        api_only = api_v[~api_v["date"].dt.date.isin(scr_dates)]
-        if not api_only.empty:
-            lines.append(f"  API-only events on dates not in scraper ({len(api_only)}):")
-            for _, row in api_only.head(10).iterrows():
-                lines.append(f"    {row['date'].date()}  {row['name'][:60]}")
-            if len(api_only) > 10:
-                lines.append(f"    ... and {len(api_only) - 10} more")
+        venue_count = len(dates_d64)
+        out_venue[out_i : out_i + venue_count] = venue_name
+        out_date[out_i : out_i + venue_count] = dates_d64
+        out_name[out_i : out_i + venue_count] = names_raw
+        out_matched[out_i : out_i + venue_count] = matched_flags
+        out_i += venue_count
 
     lines.append("\n" + "=" * 70)
     lines.append("SUMMARY")
@@ -145,14 +267,23 @@ def main():
     lines.append(f"Scraper total events ({len(scraper_venues)} venues):       {len(scr_df)}")
 
     report_text = "\n".join(lines)
-    print(report_text)
+    if not args.quiet:
+        print(report_text)
 
-    with open(args.report_out, "w", encoding="utf-8") as file:
+    # A 1 MiB buffer lets the whole report flush in a single write syscall.
+    with open(args.report_out, "w", encoding="utf-8", buffering=1 << 20) as file:
         file.write(report_text)
     print(f"\nSaved {args.report_out}")
 
-    if detail_rows:
-        detail_df = pd.DataFrame(detail_rows)
+    if out_i:
+        detail_df = pd.DataFrame(
+            {
+                "venue": out_venue[:out_i],
+                "date": out_date[:out_i],
+                "scraper_name": out_name[:out_i],
+                "matched_in_api": out_matched[:out_i],
+            }
+        )
         detail_df.to_csv(args.detail_out, index=False)
         print(f"Saved {args.detail_out}")
 